@@ -1,5 +1,6 @@
 
 import pandas as pd
+from functools import lru_cache
 from math import exp, ceil, floor, log10
 from numpy import arange, clip, isnan
 import json
@@ -70,6 +71,7 @@ class NewUnitAdoption:
         # 'Unit Adoption Calculations'!C198:C244 = "Land Units Adopted" - REF
         return self.implementation_units.copy()
 
+    @lru_cache()
     def annual_breakout(self, expected_lifetime) -> pd.Series:
         """Return a time series breakout of new units per year, including replacements. Use to calculate operating cost, lifetime operating savings, and net profit margin.
 
@@ -127,8 +129,8 @@ class NewUnitAdoption:
         """Return a time series of the operating costs, summed by year."""
 
         # After multiplying by (1+ disturbance_rate), this should equal the time series SUM($C266:$AV266) in [Operating Cost] worksheet 
-        result = self.annual_breakout(expected_lifetime)
-        result *= operating_cost
+        # annual_breakout is cached, so don't modify it in place.
+        result = self.annual_breakout(expected_lifetime) * operating_cost
         cost_series = result.sum(axis='columns')
         return cost_series
 
@@ -150,6 +152,7 @@ class NewUnitAdoption:
         cost_series = self.implementation_units.loc[:].apply(lambda x: x**param_b) * first_cost
         return cost_series
 
+    @lru_cache()
     def get_annual_world_first_cost(self, expected_lifetime, first_cost) -> pd.Series:
         """Return a time series of the number of units implemented per year multiplied by the first cost"""
         # For the custom pds scenario, this is the time series referred to by cell $E$36 in the spreadsheet.
@@ -159,6 +162,7 @@ class NewUnitAdoption:
         return result
 
 
+    @lru_cache()
     def get_lifetime_operating_savings(self, expected_lifetime, operating_cost) -> pd.Series:
         """Return a time series of operating savings over the reporting period by year, multiplied by the operating cost."""
         # After muliplying by (1 + disturbance_rate) this should match the time series in [Operating Cost]!$C$125
@@ -226,12 +230,14 @@ class NewUnitAdoption:
         series = pd.DataFrame(self._area_units).apply(lambda x: m * x.name + c, axis='columns')
 
         self._area_units = series
+        self._clear_area_units_cache()
         return 
 
     def apply_linear_regression(self) -> None:
         """Apply a linear regression to the time series representing the total land/ocean area."""
         df = interp.linear_trend(self.get_area_units())
         self._area_units = df['adoption']
+        self._clear_area_units_cache()
         return
     
     def apply_clip(self, lower = None, upper = None) -> None:
@@ -239,6 +245,11 @@ class NewUnitAdoption:
         if lower == None and upper == None:
             print('Warning : Neither lower nor upper parameter supplied. No action taken.')
         self._area_units.clip(lower=lower, upper=upper, inplace=True)
+        self._clear_area_units_cache()
+
+    def _clear_area_units_cache(self) -> None:
+        """Discard cached results that depend on the total land/ocean area time series."""
+        NewUnitAdoption.get_carbon_sequestration.cache_clear()
 
     def get_cumulative_degraded_unprotected_area(self, delay_impact_of_protection_by_one_year: bool,
                      growth_rate_of_ocean_degradation: float) -> pd.Series:
@@ -432,6 +443,7 @@ class NewUnitAdoption:
             
         return result
     
+    @lru_cache()
     def get_carbon_sequestration(
             self,
             sequestration_rate,
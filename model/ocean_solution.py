@@ -1,6 +1,9 @@
 
+import copy
 import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from math import floor, ceil
 from typing import Optional
 
@@ -9,14 +12,40 @@ import numpy as np
 import json
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from model.ocean_scenario import OceanScenario
 from model.new_unit_adoption import NewUnitAdoption as UnitAdoption
 from model.ocean_tam import OceanTam
 from model.solution import Solution
 
+@dataclass(frozen=True)
+class OceanConfig:
+    """Contents of an ocean solution configuration file. Field names match the keys in the yaml file."""
+    required_python_version_minimum : str
+    scenarios_file : str
+    PDS_adoption_file : str
+    REF_adoption_file : str
+    base_year : int
+    start_year : int
+    end_year : int
+    TAM_data_file : Optional[str] = None
+    grid_emissions_factors : Optional[str] = None
+
+@lru_cache(maxsize=32)
+def _build_unit_adoption(base_year: int, start_year: int, end_year: int, adoption_scenario_name: str,
+            adoption_input_file: str, mtime: float) -> UnitAdoption:
+    """Parse an adoption scenario from file. Results are cached, keyed on the file modification time (mtime) so edited files are re-read."""
+    return UnitAdoption(base_year, start_year, end_year, adoption_scenario_name, adoption_input_file)
+
 class OceanSolution(Solution):
     """Implement all the calculations required for solutions in the Ocean sector."""
-    _config : dict
+    _config : OceanConfig
+    _scenarios : Optional[dict]
+    _net_carbon_sequestration_cache : dict
     scenario : OceanScenario
     _tam : OceanTam
     has_tam: bool
@@ -24,28 +53,32 @@ class OceanSolution(Solution):
 
     def _load_config_file(self, file_name: str):
         
-        stream = open(file_name, 'r')
-        config = yaml.load(stream, Loader=yaml.FullLoader)
-        self.start_year = config['start_year']
-        self.end_year = config['end_year']
-        self.base_year = config['base_year']
-
-        self.pds_adoption_file = config['PDS_adoption_file']
-        self.ref_adoption_file = config['REF_adoption_file']
-        self.scenarios_file = config['scenarios_file']
-
-        self.required_version_minimum = tuple(int(st) for st in str.split(config['required_python_version_minimum'], '.'))
+        with open(file_name, 'rb') as stream:
+            # Missing or unknown keys are reported here, rather than when first used.
+            config = OceanConfig(**yaml.load(stream, Loader=SafeLoader))
+        self.start_year = config.start_year
+        self.end_year = config.end_year
+        self.base_year = config.base_year
+
+        self.pds_adoption_file = config.PDS_adoption_file
+        self.ref_adoption_file = config.REF_adoption_file
+        self.scenarios_file = config.scenarios_file
+        self._scenarios = None # read on first use
+
+        self.required_version_minimum = tuple(int(st) for st in str.split(str(config.required_python_version_minimum), '.'))
         self._config = config
 
     def _load_adoption_scenario(self, adoption_input_file: str, adoption_scenario_name: str):
             
         try:
-            ad_scenario = UnitAdoption(self.base_year, self.start_year, self.end_year, adoption_scenario_name, adoption_input_file)
+            mtime = os.path.getmtime(adoption_input_file)
+            ad_scenario = _build_unit_adoption(self.base_year, self.start_year, self.end_year, adoption_scenario_name, adoption_input_file, mtime)
         except ValueError as ev:
             print(ev.args)
             raise ValueError(f"Unable to initialise {adoption_scenario_name}")
         
-        return ad_scenario
+        # The cached object is shared, so hand out a copy that callers are free to modify.
+        return copy.deepcopy(ad_scenario)
 
     def _load_pds_scenario(self):
         self.pds_scenario = self._load_adoption_scenario(self.pds_adoption_file,
@@ -62,10 +95,10 @@ class OceanSolution(Solution):
         if sys.version_info < self.required_version_minimum:
             print(f'Warning - you are running python version {sys.version}. Version {self.required_version_minimum} or greater is required.')
         
-        self.has_tam = self._config.get('TAM_data_file', False)
+        self.has_tam = bool(self._config.TAM_data_file)
         if self.has_tam:
             # proceed to load the tam file
-            tam_file = self._config['TAM_data_file']
+            tam_file = self._config.TAM_data_file
             if not os.path.isfile(tam_file):
                 msg = f'Cannot find file {tam_file}.'
                 raise ValueError(msg)
@@ -75,15 +108,15 @@ class OceanSolution(Solution):
             self._tam = tam
             self.has_tam = True
 
-        self.has_grid_emissions_factors = self._config.get('grid_emissions_factors', False)
+        self.has_grid_emissions_factors = bool(self._config.grid_emissions_factors)
         if self.has_grid_emissions_factors:
-            gef_file = self._config['grid_emissions_factors']
+            gef_file = self._config.grid_emissions_factors
             if not os.path.isfile(gef_file):
                 msg = f'Cannot find file {gef_file}.'
                 raise ValueError(msg)
 
-            stream = open(gef_file,'r')
-            json_dict = json.load(stream)
+            with open(gef_file, 'rb') as stream:
+                json_dict = json.load(stream)
             
             idx, vals = zip(*json_dict['data']) # list of two-element lists
             self._grid_emissions_factors = pd.Series(data=vals, index=idx)
@@ -108,8 +141,7 @@ class OceanSolution(Solution):
         """Read the scenario inputs file. Load the pds scenario, ref scenario and set up the unit adoption."""
         print(f'Loading scenario {scenario_name}')
 
-        input_stream = open(self.scenarios_file, 'r')
-        scen_dict = json.load(input_stream)
+        scen_dict = self._get_scenarios()
 
         if scenario_name not in scen_dict.keys():
             raise ValueError(f"Unable to find {scenario_name} in scenario file: {self.scenarios_file}")
@@ -129,12 +161,26 @@ class OceanSolution(Solution):
         self.set_up_area_units(self.pds_scenario)
         self.set_up_area_units(self.ref_scenario)
 
+        # Row positions of the reporting years in the units adopted series, so lookups can skip the label index.
+        pds_index = self.pds_scenario.implementation_units.index
+        ref_index = self.ref_scenario.implementation_units.index
+        self._pds_start_idx = pds_index.get_loc(self.start_year)
+        self._pds_end_idx = pds_index.get_loc(self.end_year)
+        self._ref_end_idx = ref_index.get_loc(self.end_year)
+
+        self._net_carbon_sequestration_cache = {}
+
+    def _get_scenarios(self) -> dict:
+        """Return the contents of the scenario inputs file, reading it only the first time it is needed."""
+        if self._scenarios is None:
+            with open(self.scenarios_file, 'rb') as input_stream:
+                self._scenarios = json.load(input_stream)
+
+        return self._scenarios
+
     def get_scenario_names(self):
         """Find all scenario names configure in the scenario inputs file."""
-        input_stream = open(self.scenarios_file, 'r')
-        scen_dict = json.load(input_stream)
-        
-        return list(scen_dict.keys())
+        return list(self._get_scenarios().keys())
 
     def get_loaded_scenario_name(self):
         """Return the name of the loaded scenario."""
@@ -150,15 +196,14 @@ class OceanSolution(Solution):
 
         pds_series = self.pds_scenario.get_units_adopted() 
         ref_series = self.ref_scenario.get_units_adopted()
-        net_series = pds_series.subtract(ref_series)
-        return net_series.loc[self.end_year]
+        return pds_series.iat[self._pds_end_idx] - ref_series.iat[self._ref_end_idx]
         
     def get_adoption_unit_increase_pds_final_year(self) -> float:
         """Return the functional units adopted in the pds scenario only, for the final year of the reporting period."""
         # Presented on the "Advanced Controls" tab:
         # "Global Units of Adoption in 2050"
         pds_series = self.pds_scenario.get_units_adopted() 
-        return pds_series.loc[self.end_year]
+        return pds_series.iat[self._pds_end_idx]
 
     def get_global_percent_adoption_base_year(self) -> float:
         """ Return the world current adoption as a percentage of the total functional units adopted for the base year."""
@@ -176,7 +221,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Global Percent Adoption in Year 1: 2020"
         pds_series = self.pds_scenario.get_units_adopted()
-        pds_start_year = pds_series.loc[self.start_year]
+        pds_start_year = pds_series.iat[self._pds_start_idx]
 
         if self.has_tam:
             area_units_series = self._tam.get_tam_series()
@@ -193,7 +238,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Global Percent Adoption in Year 2: 2050"
         pds_series = self.pds_scenario.get_units_adopted()
-        pds_start_year = pds_series.loc[self.end_year]
+        pds_start_year = pds_series.iat[self._pds_end_idx]
 
         if self.has_tam:
             area_units_series = self._tam.get_tam_series()
@@ -278,33 +323,35 @@ class OceanSolution(Solution):
 
         Calculated only for new or replacement units installed during the analysis period. Fixed and Variable costs that are constant or changing over time are included.
         """
-        # Each cell in ref_series should match SUM($C262:$AV262) in [Operating Cost] worksheet.
+        scenario = self.scenario
+        # After multiplying by (1 + disturbance_rate), each cell in pds_solution_series should match SUM($C262:$AV262) in [Operating Cost] worksheet.
         pds_solution_series = self.pds_scenario.get_operating_cost(
-                self.scenario.solution_expected_lifetime,
-                self.scenario.solution_operating_cost
-                ) * (1+ self.scenario.disturbance_rate)
+                scenario.solution_expected_lifetime,
+                scenario.solution_operating_cost
+                )
 
-        # Each cell in ref_series should match SUM($C403:$AV403) in [Operating Cost] worksheet.
+        # After multiplying by (1 + disturbance_rate), each cell in ref_solution_series should match SUM($C403:$AV403) in [Operating Cost] worksheet.
         ref_solution_series = self.ref_scenario.get_operating_cost(
-                self.scenario.solution_expected_lifetime,
-                self.scenario.solution_operating_cost
-                ) * (1+self.scenario.disturbance_rate)
+                scenario.solution_expected_lifetime,
+                scenario.solution_operating_cost
+                )
 
         net_solution_series = pds_solution_series - ref_solution_series
 
         pds_conventional_series = self.pds_scenario.get_operating_cost(
-                self.scenario.solution_expected_lifetime,
-                self.scenario.conventional_operating_cost
-                ) * (1+ self.scenario.disturbance_rate)
+                scenario.solution_expected_lifetime,
+                scenario.conventional_operating_cost
+                )
         
         ref_conventional_series = self.ref_scenario.get_operating_cost(
-                self.scenario.solution_expected_lifetime,
-                self.scenario.conventional_operating_cost
-                ) * (1+self.scenario.disturbance_rate)
+                scenario.solution_expected_lifetime,
+                scenario.conventional_operating_cost
+                )
 
         net_conventional_series = pds_conventional_series - ref_conventional_series
         result = net_conventional_series - net_solution_series
-        result = result * self.scenario.unit_converting_factor
+        # Every term is scaled by (1 + disturbance rate), so apply it once together with the unit conversion.
+        result = result * ((1 + scenario.disturbance_rate) * scenario.unit_converting_factor)
         
         return result
 
@@ -314,8 +361,8 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab.
         # "Net Operating Savings 2020-2050
         operating_cost_series = self.get_operating_cost_series()
-        cumulative = operating_cost_series.cumsum()
-        result = cumulative.loc[self.end_year] - cumulative.loc[self.start_year]
+        # Equivalent to cumulative sum at end year minus cumulative sum at start year.
+        result = operating_cost_series.loc[self.start_year + 1: self.end_year].sum()
         result = result / 1e9 # in billions
         return result
 
@@ -346,18 +393,24 @@ class OceanSolution(Solution):
 
         results : list[float] = []
         to_append = first_val
+
+        # Loop invariants, read once rather than on every iteration.
+        solution_expected_lifetime = self.scenario.solution_expected_lifetime
+        conventional_expected_lifetime = self.scenario.conventional_expected_lifetime
+        conventional_first_cost = self.scenario.conventional_first_cost
+        operating_cost_saving = self.scenario.conventional_operating_cost - self.scenario.solution_operating_cost
         
-        solution_lifetime = ceil(self.scenario.solution_expected_lifetime)
+        solution_lifetime = ceil(solution_expected_lifetime)
 
         for year in range(ceil(solution_lifetime)):
-            effective_operating_cost = self.scenario.conventional_operating_cost - self.scenario.solution_operating_cost
-            remaining_solution_life = self.scenario.solution_expected_lifetime - year
-            remaining_conventional_life = self.scenario.conventional_expected_lifetime - year
+            effective_operating_cost = operating_cost_saving
+            remaining_solution_life = solution_expected_lifetime - year
+            remaining_conventional_life = conventional_expected_lifetime - year
 
             if not solution_only:
                 if remaining_conventional_life < 1.0 and remaining_conventional_life > 0.0:
-                    to_append += self.scenario.conventional_first_cost * min(1.0, (self.scenario.solution_expected_lifetime - year) / self.scenario.conventional_expected_lifetime)
-                    to_append += self.scenario.conventional_operating_cost - self.scenario.solution_operating_cost
+                    to_append += conventional_first_cost * min(1.0, (solution_expected_lifetime - year) / conventional_expected_lifetime)
+                    to_append += operating_cost_saving
                     to_append *= discount_factor**(years_old_at_start + year + 1)
                     results.append(to_append)
                     to_append = 0.0
@@ -386,18 +439,32 @@ class OceanSolution(Solution):
         result_sum = lifetime_cashflow_npv_series.sum()
         return result_sum / 1e9 # in Billions USD
 
+    def _get_net_cash_flow(self) -> tuple[pd.Index, np.ndarray]:
+        """Return the years and values of the undiscounted cashflows (first cost and operating savings) of all implementation units."""
+        annual_world_first_cost_series = self.get_annual_world_first_cost_series()
+        operating_cost_series = self.get_operating_cost_series()
+        index = operating_cost_series.index.union(annual_world_first_cost_series.index)
+        operating_cost = operating_cost_series.reindex(index).to_numpy(dtype=np.float64)
+        first_cost = annual_world_first_cost_series.reindex(index).to_numpy(dtype=np.float64)
+
+        # Same as operating_cost_series.add(annual_world_first_cost_series, fill_value=0.0):
+        # a missing value counts as zero, unless both values are missing.
+        net_cash_flow = np.nan_to_num(operating_cost) + np.nan_to_num(first_cost)
+        net_cash_flow[np.isnan(operating_cost) & np.isnan(first_cost)] = np.nan
+        return index, net_cash_flow
+
+    def _get_discount_factors(self, num_rows: int) -> np.ndarray:
+        """Return the npv discount factor for each year of a cashflow, starting from 1.0 for the first year."""
+        discount_factor = 1/(1+self.scenario.npv_discount_rate)
+        return discount_factor ** np.arange(num_rows, dtype=np.float64)
+
     def get_lifetime_cashflow_npv_series(self) -> pd.Series:
         """Return the timeseries of all discounted cashflows (first cost and operating savings) for the full lifetime of all implementation units
         adopted during study period."""
 
-        annual_world_first_cost_series = self.get_annual_world_first_cost_series()
-        operating_cost_series = self.get_operating_cost_series()
-        net_cash_flow = operating_cost_series.add(annual_world_first_cost_series, fill_value=0.0)
-        rate = self.scenario.npv_discount_rate
-        discount_factor = 1/(1+rate)
-        num_rows = net_cash_flow.shape[0]
-        discount_factors = [discount_factor**row for row in range(num_rows)]
-        npv = net_cash_flow.multiply(discount_factors, axis='index')
+        index, net_cash_flow = self._get_net_cash_flow()
+        discount_factors = self._get_discount_factors(len(index))
+        npv = pd.Series(net_cash_flow * discount_factors, index=index)
         return npv
 
     def get_lifetime_cashflow_npv_all(self) -> float:
@@ -406,10 +473,26 @@ class OceanSolution(Solution):
         # Presented on the "Detailed Results" tab:
         # "Lifetime Cashflow NPV of All Implementation Units (PDS compared to REF Scenario)"
         
-        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_series()
-        result_sum = lifetime_cashflow_npv_series.sum()
+        index, net_cash_flow = self._get_net_cash_flow()
+        discount_factors = self._get_discount_factors(len(index))
+        # nan_to_num skips missing years, as Series.sum() would.
+        result_sum = np.nan_to_num(net_cash_flow) @ discount_factors
         return result_sum / 1e9
 
+    def _get_payback_period(self, purchase_year: Optional[int], discount_rate: float, solution_only: Optional[bool] = False) -> int:
+        """Return the number of years until the cumulative cashflow of a single implementation unit becomes positive, or -1 if it never does."""
+        if purchase_year is None:
+            purchase_year = self.start_year - 3 # apply default
+
+        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_single_series(purchase_year, discount_rate, solution_only=solution_only)
+        is_positive = lifetime_cashflow_npv_series.values.cumsum() > 0.0
+        # argmax stops at the first True, without listing every positive position.
+        first_positive = is_positive.argmax()
+
+        if not is_positive[first_positive]:
+            return -1
+
+        return lifetime_cashflow_npv_series.index[first_positive] - self.base_year + 1
 
     def get_payback_period_solution_only(self, purchase_year: Optional[int] = None) -> int:
         """Return the length of time taken to recover all investments costs where cashflows are NOT discounted.
@@ -420,19 +503,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Payback Period Solution Alone"
 
-        if purchase_year is None:
-            purchase_year = self.start_year-3 # Apply default
-
-        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_single_series(purchase_year, discount_rate=0.0, solution_only=True)
-        cumulative_lifetime_cashflow_npv_series = lifetime_cashflow_npv_series.cumsum()
-
-        result: int =-1
-        for year, val in cumulative_lifetime_cashflow_npv_series.items():
-            if val>0.0:
-                result = year - self.base_year + 1
-                break
-
-        return result
+        return self._get_payback_period(purchase_year, discount_rate=0.0, solution_only=True)
 
     def get_payback_period_solution_only_npv(self, purchase_year: Optional[int] = None) -> int:
         """Return the length of time taken to recover all investments costs where cashflows ARE discounted.
@@ -443,19 +514,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Discounted Payback Period Solution Alone"
 
-        if purchase_year is None:
-            purchase_year = self.start_year-3 # Apply default
-
-        lifetime_cashflow_npv_single_series = self.get_lifetime_cashflow_npv_single_series(purchase_year, self.scenario.npv_discount_rate, solution_only=True)
-        cumulative_lifetime_cashflow_npv_series = lifetime_cashflow_npv_single_series.cumsum()
-
-        result: int =-1
-        for idx, val in cumulative_lifetime_cashflow_npv_series.items():
-            if val>0.0:
-                result = idx - self.base_year + 1
-                break
-
-        return result
+        return self._get_payback_period(purchase_year, discount_rate=self.scenario.npv_discount_rate, solution_only=True)
 
 
     def get_payback_period_solution_vs_conventional(self, purchase_year: Optional[int]  = None) -> int:
@@ -467,20 +526,7 @@ class OceanSolution(Solution):
         # "Payback Period Solution Relative to Conventional"
 
         #$K$122 on Operating Cost spreadsheet tab.
-
-        if purchase_year is None:
-            purchase_year = self.start_year - 3 # apply default
- 
-        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_single_series(purchase_year, discount_rate=0.0)
-        cumulative_lifetime_cashflow_npv_series = lifetime_cashflow_npv_series.cumsum()
-
-        result: int =-1
-        for idx, val in cumulative_lifetime_cashflow_npv_series.items():
-            if val>0.0:
-                result = idx - self.base_year + 1
-                break
-
-        return result
+        return self._get_payback_period(purchase_year, discount_rate=0.0)
 
 
     def get_payback_period_solution_vs_conventional_npv(self, purchase_year: Optional[int] = None) -> int:
@@ -491,24 +537,8 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Discounted Payback Period Solution Relative to Conventional"
 
-        if purchase_year is None:
-            purchase_year = self.start_year - 3 # apply default
-        
         #$K$122 on Operating Cost spreadsheet tab.
-
-        if purchase_year is None:
-            purchase_year = self.start_year - 3 # apply default
- 
-        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_single_series(purchase_year, discount_rate=self.scenario.npv_discount_rate)
-        cumulative_lifetime_cashflow_npv_series = lifetime_cashflow_npv_series.cumsum()
-
-        result:int =-1
-        for idx, val in cumulative_lifetime_cashflow_npv_series.items():
-            if val>0.0:
-                result = idx - self.base_year + 1
-                break
-
-        return result
+        return self._get_payback_period(purchase_year, discount_rate=self.scenario.npv_discount_rate)
 
     def get_abatement_cost(self) -> float:
         """ Return the discounted lifetime cost of the solution.
@@ -524,27 +554,27 @@ class OceanSolution(Solution):
         total_emissions_reduction = emissions_reduction_series.loc[self.start_year:self.end_year].sum() / 1000
         total_co2_reduction = total_emissions_reduction + total_co2_sequestered
 
-        lifetime_cashflow_npv_series = self.get_lifetime_cashflow_npv_series()
-        npv_summed = lifetime_cashflow_npv_series.loc[self.start_year:self.end_year].sum()
+        index, net_cash_flow = self._get_net_cash_flow()
+        discount_factors = self._get_discount_factors(len(index))
+        first, last = index.slice_locs(self.start_year, self.end_year)
+        npv_summed = np.nan_to_num(net_cash_flow[first:last]) @ discount_factors[first:last]
         
         result = -1 * npv_summed/total_co2_reduction
         return result / 1e9
 
     def get_net_profit_margin_series(self) -> pd.Series:
         """Return the time series of Net Profit Margin of all implementation units across the study period."""
-        pds_solution_margin_series = self.pds_scenario.get_net_profit_margin(self.scenario.solution_expected_lifetime, self.scenario.solution_net_profit_margin)
-        pds_solution_margin_series *= (1- self.scenario.disturbance_rate)
-        ref_solution_margin_series = self.ref_scenario.get_net_profit_margin(self.scenario.solution_expected_lifetime, self.scenario.solution_net_profit_margin)
-        ref_solution_margin_series *= (1- self.scenario.disturbance_rate)
+        scenario = self.scenario
+        pds_solution_margin_series = self.pds_scenario.get_net_profit_margin(scenario.solution_expected_lifetime, scenario.solution_net_profit_margin)
+        ref_solution_margin_series = self.ref_scenario.get_net_profit_margin(scenario.solution_expected_lifetime, scenario.solution_net_profit_margin)
         net_solution_margin_series = pds_solution_margin_series - ref_solution_margin_series
 
-        pds_conventional_margin_series = self.pds_scenario.get_net_profit_margin(self.scenario.conventional_expected_lifetime, self.scenario.conventional_net_profit_margin)
-        pds_conventional_margin_series *= (1- self.scenario.disturbance_rate)
-        ref_conventional_margin_series = self.ref_scenario.get_net_profit_margin(self.scenario.conventional_expected_lifetime, self.scenario.conventional_net_profit_margin)
-        ref_conventional_margin_series *= (1- self.scenario.disturbance_rate)
+        pds_conventional_margin_series = self.pds_scenario.get_net_profit_margin(scenario.conventional_expected_lifetime, scenario.conventional_net_profit_margin)
+        ref_conventional_margin_series = self.ref_scenario.get_net_profit_margin(scenario.conventional_expected_lifetime, scenario.conventional_net_profit_margin)
         net_conventional_margin_series = pds_conventional_margin_series - ref_conventional_margin_series
 
-        net_margin_series = net_solution_margin_series - net_conventional_margin_series
+        # Every term is scaled by (1 - disturbance rate), so apply it once to the net result.
+        net_margin_series = (net_solution_margin_series - net_conventional_margin_series) * (1 - scenario.disturbance_rate)
 
         return net_margin_series
 
@@ -554,10 +584,8 @@ class OceanSolution(Solution):
         # "Net Profit Margin 2020-2050"
 
         net_profit_margin_series = self.get_net_profit_margin_series()
-        margin_series_cum = net_profit_margin_series.cumsum()
-        end_year_val = margin_series_cum.loc[self.end_year]
-        start_year_val = margin_series_cum.loc[self.start_year]
-        result = end_year_val - start_year_val
+        # Equivalent to cumulative sum at end year minus cumulative sum at start year.
+        result = net_profit_margin_series.loc[self.start_year + 1: self.end_year].sum()
         
         return result / 1_000 # express in billions of USD
 
@@ -660,9 +688,8 @@ class OceanSolution(Solution):
 
 ### Start Carbon Sequestration Calculations ###
 
-    def get_carbon_sequestration_series(self):
-        """Return a time series of the sequestration amount for each year in the reporting period"""
-        # Should match "Carbon Sequestration Calculations" on "CO2 Calcs" worksheet.
+    def _get_pds_and_ref_carbon_sequestration(self) -> tuple[pd.Series, pd.Series]:
+        """Return the pds and ref time series of the sequestration amount, before netting."""
         pds_sequestration = self.pds_scenario.get_carbon_sequestration(
                     self.scenario.sequestration_rate_all_ocean,
                     self.scenario.disturbance_rate,
@@ -678,34 +705,59 @@ class OceanSolution(Solution):
                     self.scenario.delay_impact_of_protection_by_one_year,
                     self.scenario.delay_regrowth_of_degraded_land_by_one_year,
                     self.scenario.use_adoption_for_carbon_sequestration_calculation)
+
+        return pds_sequestration, ref_sequestration
+
+    def _get_net_carbon_sequestration(self) -> tuple[pd.Index, np.ndarray]:
+        """Return the years and values of the net (pds - ref) sequestration, calculated once per loaded scenario and set of sequestration inputs."""
+        key = (self.scenario.sequestration_rate_all_ocean,
+               self.scenario.disturbance_rate,
+               self.scenario.growth_rate_of_ocean_degradation,
+               self.scenario.delay_impact_of_protection_by_one_year,
+               self.scenario.delay_regrowth_of_degraded_land_by_one_year,
+               self.scenario.use_adoption_for_carbon_sequestration_calculation)
+
+        if key not in self._net_carbon_sequestration_cache:
+            pds_sequestration, ref_sequestration = self._get_pds_and_ref_carbon_sequestration()
+            net_sequestration = (pds_sequestration - ref_sequestration)
+            self._net_carbon_sequestration_cache[key] = (net_sequestration.index, net_sequestration.to_numpy())
+
+        return self._net_carbon_sequestration_cache[key]
+
+    def get_carbon_sequestration_series(self):
+        """Return a time series of the sequestration amount for each year in the reporting period"""
+        # Should match "Carbon Sequestration Calculations" on "CO2 Calcs" worksheet.
+        index, net_sequestration = self._get_net_carbon_sequestration()
         
         # net_sequestration should equal 'CO2-eq PPM Calculator' on tab [CO2 Calcs]!$B$224
-        net_sequestration = (pds_sequestration - ref_sequestration)
-        return net_sequestration
+        # Copy, so callers can't modify the cached values.
+        return pd.Series(net_sequestration, index=index, copy=True)
 
     def get_total_co2_sequestered(self) -> float:
         """The total CO2-eq sequestered in the PDS but not in the REF Scenario."""
         ## Key Climate Result ##
         # Presented on the "Advanced Controls" tab:
         # "Total Additional CO2-eq Sequestered"        
-        carbon_sequestration_series = self.get_carbon_sequestration_series()
-        result = carbon_sequestration_series.loc[self.start_year + 1: self.end_year].sum()
+        index, net_sequestration = self._get_net_carbon_sequestration()
+        first, last = index.slice_locs(self.start_year + 1, self.end_year)
+        result = np.nansum(net_sequestration[first:last])
         return result / 1_000 # express in billions of USD
 
     def get_max_annual_co2_sequestered(self) -> float:
         """Return the highest rate of sequestration during the period of analysis."""
         # Presented on the "Advanced Controls" tab:
         # "Max Annual CO2 Sequestered"
-        carbon_sequestration_series = self.get_carbon_sequestration_series()
-        result = max(carbon_sequestration_series.loc[self.start_year: self.end_year])
+        index, net_sequestration = self._get_net_carbon_sequestration()
+        first, last = index.slice_locs(self.start_year, self.end_year)
+        result = net_sequestration[first:last].max()
         return result / 1_000
     
     def get_co2_sequestered_final_year(self) -> float:
         """Return CO2 Sequestered in the final year of the reporting period."""
         # Presented on the "Advanced Controls" tab:
         # "CO2 Sequestered in 2050"
-        carbon_sequestration_series = self.get_carbon_sequestration_series()        
-        result = carbon_sequestration_series.loc[self.end_year]
+        index, net_sequestration = self._get_net_carbon_sequestration()
+        result = net_sequestration[index.get_loc(self.end_year)]
         return result / 1_000
 
 ### End Carbon Sequestration Calculations ###
@@ -771,7 +823,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Approximate PPM Equivalent Change"
         change_in_ppm_equivalent_series = self.get_change_in_ppm_equivalent_series()
-        result = change_in_ppm_equivalent_series.loc[self.end_year]
+        result = change_in_ppm_equivalent_series.at[self.end_year]
         return result
 
     def get_change_in_ppm_equivalent_final_year(self) -> float:
@@ -779,7 +831,7 @@ class OceanSolution(Solution):
         # Presented on the "Advanced Controls" tab:
         # "Approximate PPM rate in 2050"
         change_in_ppm_equivalent_series = self.get_change_in_ppm_equivalent_series()
-        result = change_in_ppm_equivalent_series.loc[self.end_year] - change_in_ppm_equivalent_series.loc[self.end_year-1]
+        result = change_in_ppm_equivalent_series.at[self.end_year] - change_in_ppm_equivalent_series.at[self.end_year-1]
         return result
         
 ### End PPM Equivalent Calculations ###
@@ -814,7 +866,8 @@ class OceanSolution(Solution):
             self.scenario.delay_impact_of_protection_by_one_year,
             self.scenario.disturbance_rate
             )
-        degraded_area_under_protection_end_year = cumulative_degraded_area_under_protection_pds.loc[self.end_year]
+        # Indexed like the pds units adopted series.
+        degraded_area_under_protection_end_year = cumulative_degraded_area_under_protection_pds.iat[self._pds_end_idx]
         adoption_unit_increase_pds_final_year = self.get_adoption_unit_increase_pds_final_year()        
         result = adoption_unit_increase_pds_final_year + degraded_area_under_protection_end_year
         result *= self.scenario.carbon_storage_in_protected_area_type